@@ -8,87 +8,171 @@ Usage:
 This reduces file size while preserving conversation flow.
 """
 
-import json
 import argparse
+import os
+import shutil
 import sys
+import tempfile
+from collections import deque
 from pathlib import Path
 
+try:
+    import orjson
 
-def truncate_content(obj, max_size=1000, path="", in_tool_result=False):
-    """Recursively truncate large string content in nested structures.
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+# Read/write buffer size for session files, which can reach hundreds of MB
+IO_BUFFER_SIZE = 1 << 20
+
+
+def truncate_inplace(root, max_size=1000):
+    """Truncate large string content in nested structures, in place.
 
     Only truncates content in tool_result blocks to preserve:
     - thinking blocks (have cryptographic signatures)
     - user messages
     - assistant text responses
+
+    Walks the tree with an explicit stack and only assigns into containers
+    whose strings actually need truncating.
+    """
+    stack = [(root, False)]
+    while stack:
+        obj, in_tool_result = stack.pop()
+        if isinstance(obj, dict):
+            # Check if this is a thinking block (has signature) - never truncate
+            if obj.get('type') == 'thinking' and 'signature' in obj:
+                continue
+            # Check if this is a tool_result block
+            in_tool_result = in_tool_result or obj.get('type') == 'tool_result'
+            items = obj.items()
+        elif isinstance(obj, list):
+            items = enumerate(obj)
+        else:
+            continue
+
+        for key, value in items:
+            if isinstance(value, str):
+                # Only truncate strings inside tool_result content
+                if in_tool_result and len(value) > max_size:
+                    half = max_size // 2
+                    obj[key] = f"{value[:half]}\n\n... [TRUNCATED {len(value) - max_size} chars] ...\n\n{value[-half:]}"
+            elif isinstance(value, (dict, list)):
+                stack.append((value, in_tool_result))
+    return root
+
+
+def _nonblank_lines(f):
+    """Yield stripped, non-empty raw lines from a session file opened in binary mode."""
+    for line in f:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def _keep_last_lines(lines, keep_last):
+    """Keep only the last N raw lines, plus a leading file-history-snapshot.
+
+    Only the raw (undecoded) lines are buffered, in a bounded deque.
+    Returns (kept lines, total line count).
     """
-    if isinstance(obj, str):
-        # Only truncate strings inside tool_result content
-        if in_tool_result and len(obj) > max_size:
-            half = max_size // 2
-            return f"{obj[:half]}\n\n... [TRUNCATED {len(obj) - max_size} chars] ...\n\n{obj[-half:]}"
-        return obj
-    elif isinstance(obj, dict):
-        # Check if this is a thinking block (has signature) - never truncate
-        if obj.get('type') == 'thinking' and 'signature' in obj:
-            return obj
-        # Check if this is a tool_result block
-        is_tool_result = obj.get('type') == 'tool_result'
-        return {k: truncate_content(v, max_size, f"{path}.{k}", in_tool_result or is_tool_result)
-                for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [truncate_content(item, max_size, f"{path}[]", in_tool_result) for item in obj]
-    return obj
+    first_line = next(lines, None)
+    if first_line is None:
+        return [], 0
 
+    tail = deque([first_line], maxlen=keep_last)
+    total = 1
+    for line in lines:
+        tail.append(line)
+        total += 1
 
-def compact_session(input_path, output_path, max_content_size=1000, keep_last=None, dry_run=False):
-    """Compact a session file."""
-    lines = []
-
-    with open(input_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                lines.append(json.loads(line))
-
-    original_count = len(lines)
-
-    # Keep only last N messages if specified
-    if keep_last and len(lines) > keep_last:
-        # Always keep the first line (usually file-history-snapshot)
-        first_line = lines[0] if lines[0].get('type') == 'file-history-snapshot' else None
-        lines = lines[-keep_last:]
-        if first_line:
-            lines.insert(0, first_line)
-
-    # Truncate large content
-    compacted = []
+    # Always keep the first line (usually file-history-snapshot)
+    if total > keep_last and _loads(first_line).get('type') == 'file-history-snapshot':
+        return [first_line, *tail], total
+    return tail, total
+
+
+def _write_compacted(lines, max_content_size, write=None):
+    """Truncate and serialize each line, passing it to write() if given.
+
+    Returns (message count, serialized size in bytes).
+    """
+    count = 0
+    size = 0
     for line in lines:
-        compacted.append(truncate_content(line, max_content_size))
+        # Only lines with a tool_result long enough to hold an oversized string
+        # can change; pass everything else through without decoding it
+        if b'"tool_result"' not in line or len(line) <= max_content_size:
+            serialized = line
+        else:
+            serialized = _dumps(truncate_inplace(_loads(line), max_content_size))
+        size += len(serialized) + 1
+        count += 1
+        if write is not None:
+            write(serialized)
+            write(b'\n')
+    return count, size
+
 
-    # Calculate sizes
+def compact_session(input_path, output_path, max_content_size=1000, keep_last=None, dry_run=False):
+    """Compact a session file.
+
+    Messages are streamed one at a time into a temporary file next to the
+    output, which replaces the output only once it is complete.
+    """
     original_size = Path(input_path).stat().st_size
-    compacted_json = '\n'.join(json.dumps(line, ensure_ascii=False) for line in compacted)
-    new_size = len(compacted_json.encode('utf-8'))
+    output_dir = Path(output_path).resolve().parent
+
+    # Binary mode splits lines without decoding; orjson takes the UTF-8 bytes as-is
+    with open(input_path, 'rb', buffering=IO_BUFFER_SIZE) as f_in:
+        lines = _nonblank_lines(f_in)
+        # Keep only last N messages if specified
+        if keep_last:
+            lines, original_count = _keep_last_lines(lines, keep_last)
+
+        if dry_run:
+            compacted_count, new_size = _write_compacted(lines, max_content_size)
+        else:
+            with tempfile.NamedTemporaryFile('wb', buffering=IO_BUFFER_SIZE, dir=output_dir,
+                                             prefix='.compact-', suffix='.tmp', delete=False) as f_out:
+                tmp_path = Path(f_out.name)
+                try:
+                    compacted_count, new_size = _write_compacted(lines, max_content_size, f_out.write)
+                except BaseException:
+                    f_out.close()
+                    tmp_path.unlink()
+                    raise
+
+    if not keep_last:
+        original_count = compacted_count
 
     print(f"Original: {original_size / 1024 / 1024:.1f} MB ({original_count} messages)")
-    print(f"Compacted: {new_size / 1024 / 1024:.1f} MB ({len(compacted)} messages)")
+    print(f"Compacted: {new_size / 1024 / 1024:.1f} MB ({compacted_count} messages)")
     print(f"Reduction: {(1 - new_size / original_size) * 100:.1f}%")
 
     if dry_run:
         print("\n[DRY RUN] No changes written")
         return
 
+    shutil.copymode(input_path, tmp_path)
+
     # Backup original
     backup_path = Path(input_path).with_suffix('.jsonl.bak')
     if not backup_path.exists():
         Path(input_path).rename(backup_path)
         print(f"Backup: {backup_path}")
 
-    # Write compacted
-    with open(output_path, 'w') as f:
-        f.write(compacted_json)
-        f.write('\n')
+    # Move compacted into place
+    os.replace(tmp_path, output_path)
 
     print(f"Written: {output_path}")
 
@@ -303,7 +303,85 @@ test_compare_csv() {
 }
 
 # ========================================
-# TEST 8: Import second table
+# TEST 8: Import via the opt-in PyArrow path
+# ========================================
+arrow_available() {
+    python3 -c "import pyarrow.csv" 2>/dev/null
+}
+
+test_import_csv_arrow() {
+    log_test "Import CSV with PyArrow path (use_arrow=True)"
+
+    if ! arrow_available; then
+        log_skip "Import CSV with PyArrow path (PyArrow not installed)"
+        return 0
+    fi
+
+    local result
+    result=$(python3 -c "
+import sys
+sys.path.insert(0, '$SCRIPT_DIR')
+from db_utils import get_connection, import_csv, export_csv, table_exists
+
+conn = get_connection('$DB_SERVER', '$DB_DATABASE', '$DB_USERNAME', '$DB_PASSWORD')
+rows = import_csv(conn, '$TEST_DATA_DIR/sample_products.csv', 'claude_container', 'products_arrow',
+                  create_table=True, use_arrow=True)
+exists = table_exists(conn, 'claude_container', 'products_arrow')
+exported = export_csv(conn, 'claude_container', 'products_arrow', '$OUTPUT_DIR/exported_products_arrow.csv')
+conn.close()
+
+if exists and rows == 10 and exported == 10:
+    print('OK')
+else:
+    print(f'FAIL: exists={exists}, rows={rows}, exported={exported}')
+" 2>&1)
+
+    if echo "$result" | grep -q "OK"; then
+        log_pass "Import CSV with PyArrow path (10 rows)"
+        return 0
+    else
+        log_fail "Import CSV (arrow): $result"
+        return 1
+    fi
+}
+
+# ========================================
+# TEST 9: Compare original vs PyArrow path export
+# ========================================
+test_compare_csv_arrow() {
+    log_test "Compare original vs exported CSV (PyArrow path)"
+
+    if ! arrow_available; then
+        log_skip "Compare original vs exported CSV (PyArrow not installed)"
+        return 0
+    fi
+
+    if python3 "$SCRIPT_DIR/db_utils.py" \
+        --server "$DB_SERVER" \
+        --database "$DB_DATABASE" \
+        --user "$DB_USERNAME" \
+        --password "$DB_PASSWORD" \
+        compare \
+        --file1 "$TEST_DATA_DIR/sample_products.csv" \
+        --file2 "$OUTPUT_DIR/exported_products_arrow.csv" 2>&1 | grep -q "match"; then
+        log_pass "Compare original vs exported CSV (PyArrow path)"
+        return 0
+    else
+        log_fail "CSV comparison failed (PyArrow path) - files differ"
+        python3 "$SCRIPT_DIR/db_utils.py" \
+            --server "$DB_SERVER" \
+            --database "$DB_DATABASE" \
+            --user "$DB_USERNAME" \
+            --password "$DB_PASSWORD" \
+            compare \
+            --file1 "$TEST_DATA_DIR/sample_products.csv" \
+            --file2 "$OUTPUT_DIR/exported_products_arrow.csv" 2>&1 | head -10
+        return 1
+    fi
+}
+
+# ========================================
+# TEST 10: Import second table
 # ========================================
 test_import_second_table() {
     log_test "Import second CSV (customers)"
@@ -335,7 +413,7 @@ else:
 }
 
 # ========================================
-# TEST 9: Join query across tables
+# TEST 11: Join query across tables
 # ========================================
 test_join_query() {
     log_test "Cross-table query"
@@ -371,7 +449,7 @@ else:
 }
 
 # ========================================
-# TEST 10: Cleanup (drop schema)
+# TEST 12: Cleanup (drop schema)
 # ========================================
 test_cleanup_schema() {
     log_test "Drop schema 'claude_container'"
@@ -429,6 +507,8 @@ main() {
     test_query_imported || true
     test_export_csv || true
     test_compare_csv || true
+    test_import_csv_arrow || true
+    test_compare_csv_arrow || true
 
     echo ""
     echo -e "${BLUE}=== MULTI-TABLE TESTS ===${NC}"